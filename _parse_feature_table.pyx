@@ -0,0 +1,81 @@
+# cython: language_level=3
+# =============================================================================
+# 特征表格解析（Cython编译版本）
+# =============================================================================
+# 与 commit_verifier.py 中的 parse_feature_table 行为一致，编译后自动替换纯Python版本
+# 编译命令：python setup.py build_ext --inplace
+# =============================================================================
+
+cdef bint _is_separator(str line):
+    """检查表格行是否为分隔线（如：|----|:---:|----|）"""
+    cdef Py_ssize_t i, n = len(line)
+    cdef Py_UCS4 c
+    if n < 3 or line[0] != "|" or line[n - 1] != "|":
+        return False
+    for i in range(1, n - 1):
+        c = line[i]
+        if c != "-" and c != "|" and c != ":" and not c.isspace():
+            return False
+    return True
+
+def parse_feature_table(str content, str table_header, feature_type):
+    """
+    解析Markdown文档中的特征表格
+    表格格式要求：与配置文件中table_header一致
+    feature_type：特征行类型（commit_verifier.Feature，按FEATURE_FIELDS顺序传入各列）
+    返回：解析后的特征列表（每个元素是feature_type）
+    关键字段（特征名、SHA、作者）为空的行抛出ValueError
+    """
+    cdef list features = []
+    cdef list lines, parts
+    cdef str raw, body, line, name, sha, author
+    cdef Py_ssize_t header_pos, start, i, n
+    # 1. 定位表格开始（找到配置的表头，从表头下一行开始解析）
+    header_pos = content.find(table_header)
+    if header_pos == -1:
+        return features
+    start = content.find("\n", header_pos)
+    if start == -1:
+        return features
+
+    lines = content[start + 1:].split("\n")
+    n = len(lines)
+    for i in range(n):
+        raw = lines[i]
+        # 既非表格行也非章节标记的行直接跳过（无需去除空白）
+        if "|" not in raw and "##" not in raw:
+            continue
+        body = raw.lstrip(" \t")
+        if not body:
+            continue
+
+        # 2. 定位表格结束（遇到非表格行且包含章节标记）
+        if body[0] != "|":
+            if not body[0].isspace() and "##" in body:
+                break
+            continue
+
+        # 跳过表格分隔线（左侧空白已去除，只需去除右侧）
+        line = body.rstrip()
+        if _is_separator(line):
+            continue
+
+        # 3. 解析表格行（按commit_verifier.FEATURE_FIELDS顺序取前7列，空单元格保留原位置）
+        parts = (line[1:-1] if line.endswith("|") else line[1:]).split("|")
+        if len(parts) < 7:
+            continue
+        name = (<str>parts[0]).strip()
+        sha = (<str>parts[1]).strip()
+        author = (<str>parts[2]).strip()
+        # 检查关键字段是否为空（表格格式标准化）
+        if not name or not sha or not author:
+            raise ValueError(f"特征表格行存在空关键字段：{line}")
+        features.append(feature_type(
+            name, sha, author,
+            (<str>parts[3]).strip(),    # 分支
+            (<str>parts[4]).strip(),    # 日期
+            (<str>parts[5]).strip(),    # 改动文件数
+            (<str>parts[6]).strip()     # 提交信息
+        ))
+
+    return features
@@ -10,13 +10,24 @@
 # =============================================================================
 import sys
 import os
+import json
+import threading
+from collections import namedtuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import argparse
 import yaml
 import re
 import base64
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
+# 可选依赖：orjson（C实现的JSON解析，比标准库json快），未安装时回退到标准库
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 # ==========================
 # 1. 基础配置（通用无需修改）
@@ -24,7 +35,37 @@ from dotenv import load_dotenv
 # 默认文件路径（可通过命令行参数覆盖）
 DEFAULT_ENV_FILE = ".env"  # 存储敏感信息（Token等）
 DEFAULT_CONFIG_FILE = "config_template.yaml"  # 配置模板文件
+DEFAULT_CACHE_FILE = ".commit_verifier_cache.json"  # HTTP响应缓存（ETag + 响应体），仅在指定--cache时启用
 GITHUB_API_VERSION = "application/vnd.github.v3+json"  # GitHub API 版本
+GITHUB_RAW_URL = "https://raw.githubusercontent.com"  # GitHub 文件原文地址
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"  # GitHub GraphQL API 地址
+GRAPHQL_BATCH_SIZE = 100  # 单次GraphQL请求查询的提交数上限（控制节点开销）
+MAX_WORKERS = 8  # 并发请求数上限（避免触发GitHub二级速率限制）
+# 特征表格列（格式：| 特征名 | SHA | 作者 | 分支 | 日期 | 改动文件 | 提交信息 |）
+FEATURE_FIELDS = ("name", "sha", "author", "branch", "date", "files_changed", "message")
+Feature = namedtuple("Feature", FEATURE_FIELDS)  # 解析后的特征行（按属性访问，如feat.sha）
+# 配置文件必填字段（缺一不可）
+REQUIRED_CONFIG_FIELDS = (
+    "target_repo",          # 目标仓库名
+    "target_branch",        # 目标分支
+    "feature_doc_path",     # 特征文档路径
+    "table_header",         # 特征表格表头
+    "required_sections",    # 文档必填章节
+    "min_feature_count",    # 最小特征数量
+    "expected_features",    # 预期特征（{特征名: 预期SHA}）
+    "expected_authors",     # 预期作者（{SHA: 作者名}）
+    "expected_messages",    # 预期提交信息（{SHA: 信息}）
+    "expected_dates"        # 预期日期（{SHA: 日期YYYY-MM-DD}）
+)
+# 提交详情缓存（{(组织, 仓库, SHA): 提交详情}）；GitHub提交按SHA不可变，可安全长期缓存
+_commit_cache: Dict[Tuple[str, str, str], Dict] = {}
+# 特征表格解析正则（模块加载时预编译一次）
+_ROW_RE = re.compile(r"^[ \t]*(\|.*?)[^\S\n]*$", re.MULTILINE)      # 表格行（以|开头，分组不含首尾空白）
+_SEP_RE = re.compile(r"^\|[\s\-|:]+\|$")                            # 表格分隔线
+# 章节标记：非表格行中包含##即视为表格结束；首字符用前瞻判断，避免「## 标题」的首个#被消耗导致漏判
+_SECTION_RE = re.compile(r"^[ \t]*(?=[^|\s])[^\n]*##", re.MULTILINE)  # 表格后的章节标记
+# YAML加载器：优先使用libyaml的C实现，不可用时回退到纯Python实现
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # ==========================
 # 2. 工具函数（通用无需修改）
@@ -38,13 +79,12 @@ def load_environment(env_path: str) -> Tuple[str, str]:
         print(f"❌ 错误：环境文件 {env_path} 不存在", file=sys.stderr)
         sys.exit(1)
     load_dotenv(env_path)
-    github_token = os.getenv("GITHUB_TOKEN")  # 需在.env中定义
-    github_org = os.getenv("GITHUB_ORG")      # 需在.env中定义
-    if not github_token:
-        print(f"❌ 错误：{env_path}文件中未配置 GITHUB_TOKEN", file=sys.stderr)
-        sys.exit(1)
-    if not github_org:
-        print(f"❌ 错误：{env_path}文件中未配置 GITHUB_ORG", file=sys.stderr)
+    env = os.environ
+    github_token = env.get("GITHUB_TOKEN")  # 需在.env中定义
+    github_org = env.get("GITHUB_ORG")      # 需在.env中定义
+    if not (github_token and github_org):
+        missing = [name for name, value in (("GITHUB_TOKEN", github_token), ("GITHUB_ORG", github_org)) if not value]
+        print(f"❌ 错误：{env_path}文件中未配置 {'、'.join(missing)}", file=sys.stderr)
         sys.exit(1)
     return github_token, github_org
 
@@ -58,31 +98,40 @@ def load_project_config(config_path: str) -> Dict:
         sys.exit(1)
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            if _YAML_LOADER is yaml.SafeLoader:
+                print("⚠️ 警告：未检测到libyaml，使用纯Python YAML解析器（较慢）", file=sys.stderr)
+            config = yaml.load(f, Loader=_YAML_LOADER)
         
-        # 验证配置完整性（必须包含以下字段，缺一不可）
-        required_config_fields = [
-            "target_repo",          # 目标仓库名
-            "target_branch",        # 目标分支
-            "feature_doc_path",     # 特征文档路径
-            "table_header",         # 特征表格表头
-            "required_sections",    # 文档必填章节
-            "min_feature_count",    # 最小特征数量
-            "expected_features",    # 预期特征（{特征名: 预期SHA}）
-            "expected_authors",     # 预期作者（{SHA: 作者名}）
-            "expected_messages",    # 预期提交信息（{SHA: 信息}）
-            "expected_dates"        # 预期日期（{SHA: 日期YYYY-MM-DD}）
-        ]
-        for field in required_config_fields:
-            if field not in config:
-                print(f"❌ 错误：配置文件缺少必填字段「{field}」", file=sys.stderr)
-                sys.exit(1)
+        # 验证配置完整性（一次列出所有缺失的必填字段）
+        missing = [field for field in REQUIRED_CONFIG_FIELDS if field not in config]
+        if missing:
+            print(f"❌ 错误：配置文件缺少必填字段{'、'.join(f'「{field}」' for field in missing)}", file=sys.stderr)
+            sys.exit(1)
         
         return config
     except Exception as e:
         print(f"❌ 错误：加载配置文件失败 - {str(e)}", file=sys.stderr)
         sys.exit(1)
 
+def _is_iso_date(value: str) -> bool:
+    """检查字符串是否为YYYY-MM-DD格式（定长逐字符检查，无需正则引擎；isdecimal与正则\d的匹配范围一致）"""
+    return (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdecimal()
+        and value[5:7].isdecimal()
+        and value[8:].isdecimal()
+    )
+
+class VerificationError(Exception):
+    """验证失败（异常信息即为要输出的错误信息）"""
+
+def _raise_if_errors(errors: List[str]) -> None:
+    """步骤结束时检查累积的错误信息，存在错误则合并为一个VerificationError抛出"""
+    if errors:
+        raise VerificationError("\n".join(errors))
+
 def get_github_headers(token: str) -> Dict[str, str]:
     """生成GitHub API请求头（通用无需修改）"""
     return {
@@ -91,119 +140,334 @@ def get_github_headers(token: str) -> Dict[str, str]:
         "User-Agent": "GitHub-Commit-Verifier"
     }
 
+def _load_response_cache(cache_path: Optional[str]) -> Dict[str, Dict[str, str]]:
+    """
+    加载磁盘上的HTTP响应缓存（{URL: {"etag": ETag, "body": 响应体}}）
+    缓存文件不存在或损坏时返回空缓存
+    """
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except Exception as e:
+        print(f"⚠️ 警告：读取响应缓存失败，已忽略 - {str(e)}", file=sys.stderr)
+        return {}
+
+class _ETagCacheAdapter(HTTPAdapter):
+    """
+    支持ETag条件请求的连接适配器
+    GET请求自动附带If-None-Match；返回304时使用本地缓存的响应体（304不计入GitHub主要速率限制），
+    返回200且带ETag时更新磁盘缓存
+    """
+    def __init__(self, cache_path: Optional[str], **kwargs):
+        self.cache_path = cache_path
+        self.cache = _load_response_cache(cache_path)
+        self._lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        is_get = request.method == "GET"
+        entry = self.cache.get(request.url) if is_get else None
+        if entry:
+            request.headers["If-None-Match"] = entry["etag"]
+        response = super().send(request, **kwargs)
+        if entry and response.status_code == 304:
+            response.status_code = 200
+            response._content = entry["body"].encode("utf-8")
+            response.encoding = "utf-8"
+        elif is_get and response.status_code == 200 and response.headers.get("ETag"):
+            self._store(request.url, response.headers["ETag"], response.content)
+        return response
+
+    def _store(self, url: str, etag: str, content: bytes) -> None:
+        """更新缓存条目并写回磁盘（先写临时文件再替换，避免中断导致缓存损坏）"""
+        try:
+            body = content.decode("utf-8")
+        except UnicodeDecodeError:
+            return
+        with self._lock:
+            self.cache[url] = {"etag": etag, "body": body}
+            if not self.cache_path:
+                return
+            try:
+                tmp_path = f"{self.cache_path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self.cache, f, ensure_ascii=False)
+                os.replace(tmp_path, self.cache_path)
+            except Exception as e:
+                print(f"⚠️ 警告：写入响应缓存失败 - {str(e)}", file=sys.stderr)
+
+def create_github_session(token: str, cache_path: Optional[str] = None) -> requests.Session:
+    """
+    创建复用连接的GitHub会话（HTTP keep-alive）
+    所有请求共享连接池（api.github.com、raw.githubusercontent.com各一个），避免每次请求重复TCP+TLS握手；
+    对429/502/503/504等临时错误自动重试（遵循Retry-After响应头）；
+    指定cache_path时GET请求使用ETag条件请求并缓存到磁盘
+    """
+    session = requests.Session()
+    session.headers.update(get_github_headers(token))
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+        allowed_methods=frozenset(["GET", "POST"])  # POST仅用于只读的GraphQL查询，可安全重试
+    )
+    adapter = _ETagCacheAdapter(
+        cache_path,
+        pool_connections=2,
+        pool_maxsize=MAX_WORKERS,
+        max_retries=retry
+    )
+    session.mount("https://", adapter)
+    return session
+
 def fetch_github_file(
     file_path: str,
-    headers: Dict[str, str],
+    session: requests.Session,
+    org: str,
+    repo: str,
+    branch: str
+) -> Optional[str]:
+    """
+    从GitHub仓库获取文件内容
+    优先请求raw.githubusercontent.com直接获取文件原文（无JSON封装、无Base64解码）；
+    raw地址返回404时回退到Contents API
+    返回：文件内容（字符串）；获取失败时抛出VerificationError
+    """
+    raw_url = f"{GITHUB_RAW_URL}/{org}/{repo}/{branch}/{file_path}"
+    try:
+        response = session.get(raw_url)
+        if response.status_code == 200:
+            response.encoding = "utf-8"
+            return response.text
+    except Exception as e:
+        raise VerificationError(f"❌ 错误：请求GitHub文件异常 - {str(e)}")
+    
+    if response.status_code != 404:
+        raise VerificationError(f"❌ 错误：获取文件失败（状态码：{response.status_code}）- {response.text[:100]}")
+    return _fetch_github_file_contents(file_path, session, org, repo, branch)
+
+def _fetch_github_file_contents(
+    file_path: str,
+    session: requests.Session,
     org: str,
     repo: str,
     branch: str
 ) -> Optional[str]:
     """
-    从GitHub仓库获取文件内容（自动解码Base64）
-    返回：文件内容（字符串）或None（失败）
+    通过Contents API获取文件内容（自动解码Base64）
+    返回：文件内容（字符串）；获取失败时抛出VerificationError
     """
     api_url = f"https://api.github.com/repos/{org}/{repo}/contents/{file_path}?ref={branch}"
     try:
-        response = requests.get(api_url, headers=headers)
-        
+        response = session.get(api_url)
         if response.status_code == 200:
-            data = response.json()
+            data = _json_loads(response.content)
             # GitHub API返回的文件内容是Base64编码
             if data.get("encoding") == "base64":
                 return base64.b64decode(data["content"]).decode("utf-8")
             return data.get("content", None)
-        
-        elif response.status_code == 404:
-            print(f"❌ 错误：文件 {file_path} 在 {branch} 分支不存在", file=sys.stderr)
-            return None
-        
-        else:
-            print(f"❌ 错误：获取文件失败（状态码：{response.status_code}）- {response.text[:100]}", file=sys.stderr)
-            return None
     except Exception as e:
-        print(f"❌ 错误：请求GitHub API异常 - {str(e)}", file=sys.stderr)
-        return None
+        raise VerificationError(f"❌ 错误：请求GitHub API异常 - {str(e)}")
+    
+    if response.status_code == 404:
+        raise VerificationError(f"❌ 错误：文件 {file_path} 在 {branch} 分支不存在")
+    raise VerificationError(f"❌ 错误：获取文件失败（状态码：{response.status_code}）- {response.text[:100]}")
 
-def verify_commit(
-    commit_sha: str,
-    headers: Dict[str, str],
+def _build_commits_query(count: int) -> str:
+    """
+    生成批量查询提交的GraphQL语句（仅请求校验所需字段：oid、提交信息、作者登录名）
+    每个SHA对应一个别名c0..cN，SHA通过变量传入（支持短SHA）
+    """
+    params = "".join(f", $s{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"    c{i}: object(expression: $s{i}) {{ ... on Commit {{ oid message author {{ user {{ login }} }} }} }}"
+        for i in range(count)
+    )
+    return (
+        f"query($owner: String!, $name: String!{params}) {{\n"
+        f"  repository(owner: $owner, name: $name) {{\n{fields}\n  }}\n}}"
+    )
+
+def _fetch_commit_batch(
+    commit_shas: List[str],
+    session: requests.Session,
     org: str,
     repo: str
-) -> Optional[Dict]:
+) -> Dict[str, str]:
     """
-    验证GitHub提交是否存在，并返回提交详情
-    返回：提交详情（字典）或None（失败）
+    通过单次GraphQL请求获取一批提交详情，成功的结果写入缓存
+    提交详情格式：{"login": 作者登录名, "message": 提交信息首行}
+    返回：获取失败的提交及错误信息（{SHA: 错误信息}）
     """
-    api_url = f"https://api.github.com/repos/{org}/{repo}/commits/{commit_sha}"
+    variables = {"owner": org, "name": repo}
+    variables.update({f"s{i}": sha for i, sha in enumerate(commit_shas)})
     try:
-        response = requests.get(api_url, headers=headers)
+        response = session.post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": _build_commits_query(len(commit_shas)), "variables": variables}
+        )
         
-        if response.status_code == 200:
-            return response.json()
+        if response.status_code != 200:
+            message = f"验证提交失败（状态码：{response.status_code}）- {response.text[:100]}"
+            return {sha: f"❌ 错误：提交 {sha[:8]} {message}" for sha in commit_shas}
         
-        elif response.status_code == 404:
-            print(f"❌ 错误：提交 {commit_sha[:8]} 不存在", file=sys.stderr)
-            return None
+        payload = _json_loads(response.content)
+        repository = (payload.get("data") or {}).get("repository")
+        if repository is None:
+            errors = payload.get("errors") or [{}]
+            message = f"验证提交失败 - {str(errors[0].get('message', ''))[:100]}"
+            return {sha: f"❌ 错误：提交 {sha[:8]} {message}" for sha in commit_shas}
         
-        else:
-            print(f"❌ 错误：验证提交失败（状态码：{response.status_code}）- {response.text[:100]}", file=sys.stderr)
-            return None
+        failed = {}
+        for i, sha in enumerate(commit_shas):
+            node = repository.get(f"c{i}") or {}
+            # 不存在的SHA返回null；非提交对象（如tree）返回空对象
+            if not node.get("oid"):
+                failed[sha] = f"❌ 错误：提交 {sha[:8]} 不存在"
+                continue
+            user = (node.get("author") or {}).get("user") or {}
+            _commit_cache[(org, repo, sha)] = {
+                "login": user.get("login", ""),
+                "message": (node.get("message") or "").split("\n")[0]
+            }
+        return failed
     except Exception as e:
-        print(f"❌ 错误：请求提交详情异常 - {str(e)}", file=sys.stderr)
-        return None
+        return {sha: f"❌ 错误：请求提交 {sha[:8]} 详情异常 - {str(e)}" for sha in commit_shas}
+
+def _run_in_background(func: Callable, *args) -> Callable:
+    """
+    在守护线程中执行func(*args)，返回取结果的函数（调用时等待执行完成，func抛出的异常在此重新抛出）
+    使用守护线程：主流程提前失败退出时不等待后台任务
+    （提交数超过GRAPHQL_BATCH_SIZE时verify_commits内部的线程池仍会在退出时被等待）
+    """
+    holder = {}
+    def target():
+        try:
+            holder["result"] = func(*args)
+        except BaseException as e:
+            holder["error"] = e
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    def result():
+        thread.join()
+        if "error" in holder:
+            raise holder["error"]
+        return holder["result"]
+    return result
+
+def verify_commits(
+    commit_shas: List[str],
+    session: requests.Session,
+    org: str,
+    repo: str
+) -> Tuple[Dict[str, Optional[Dict]], Dict[str, str]]:
+    """
+    批量验证GitHub提交是否存在，并返回提交详情（GraphQL，每批最多GRAPHQL_BATCH_SIZE个SHA）
+    已缓存的SHA不再请求，多个批次并发执行；错误信息不直接输出，由调用方按需汇总
+    返回：({SHA: 提交详情（{"login": 作者, "message": 提交信息首行}）或None（失败）},
+           {SHA: 错误信息（仅失败的提交）})
+    """
+    pending = [sha for sha in dict.fromkeys(commit_shas) if (org, repo, sha) not in _commit_cache]
+    batches = [pending[i:i + GRAPHQL_BATCH_SIZE] for i in range(0, len(pending), GRAPHQL_BATCH_SIZE)]
+    failed = {}
+    if len(batches) == 1:
+        failed.update(_fetch_commit_batch(batches[0], session, org, repo))
+    elif batches:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for batch_failed in executor.map(lambda batch: _fetch_commit_batch(batch, session, org, repo), batches):
+                failed.update(batch_failed)
+    return {sha: _commit_cache.get((org, repo, sha)) for sha in commit_shas}, failed
 
 # ==========================
 # 3. 核心逻辑（通用无需修改）
 # ==========================
-def parse_feature_table(content: str, table_header: str) -> List[Dict]:
+def find_missing_sections(content: str, required_sections: List[str]) -> List[str]:
+    """
+    单次扫描文档，找出所有缺失的必填章节
+    所有章节拼接为一个正则（长的优先），一次遍历收集命中的章节；
+    未命中的章节再逐个精确确认（处理章节互相重叠/包含的情况）
+    返回：缺失的章节列表（保持配置顺序）
+    """
+    if not required_sections:
+        return []
+    sections_re = re.compile("|".join(
+        re.escape(section) for section in sorted(set(required_sections), key=len, reverse=True)
+    ))
+    found = {match.group(0) for match in sections_re.finditer(content)}
+    return [
+        section for section in required_sections
+        if section not in found and section not in content
+    ]
+
+def parse_feature_table(content: str, table_header: str) -> List[Feature]:
     """
     解析Markdown文档中的特征表格
     表格格式要求：与配置文件中table_header一致
-    返回：解析后的特征列表（每个元素是特征字典）
+    返回：解析后的特征列表（每个元素是Feature）
+    关键字段（特征名、SHA、作者）为空的行抛出ValueError
     """
     features = []
-    lines = [line.strip() for line in content.split("\n")]
-    in_table = False  # 是否进入表格区域
-    for line in lines:
-        # 1. 定位表格开始（找到配置的表头）
-        if table_header in line:
-            in_table = True
+    # 1. 定位表格开始（找到配置的表头，从表头下一行开始解析）
+    header_pos = content.find(table_header)
+    if header_pos == -1:
+        return features
+    start = content.find("\n", header_pos)
+    if start == -1:
+        return features
+    
+    # 2. 定位表格结束（遇到非表格行且包含章节标记）
+    section = _SECTION_RE.search(content, start)
+    end = section.start() if section else len(content)
+    
+    # 3. 单次正则扫描表格区域内的所有表格行
+    for match in _ROW_RE.finditer(content, start, end):
+        line = match.group(1)
+        # 跳过表格分隔线（如：|----|:---:|----|）
+        if _SEP_RE.match(line):
             continue
         
-        # 2. 跳过表格分隔线（如：|----|----|----|）
-        if in_table and line.startswith("|") and all(c in "-|" for c in line.replace("|", "")):
+        # 4. 解析表格行（按FEATURE_FIELDS顺序取前7列，空单元格保留原位置）
+        parts = (line[1:-1] if line.endswith("|") else line[1:]).split("|")
+        # 确保列数与表头一致（表头示例：| Feature Name | Commit SHA | ... | 共7列）
+        if len(parts) < 7:
             continue
-        
-        # 3. 定位表格结束（遇到非表格行且包含章节标记）
-        if in_table and line and not line.startswith("|") and "##" in line:
-            break
-        
-        # 4. 解析表格行（格式：| 特征名 | SHA | 作者 | 分支 | 日期 | 改动文件 | 提交信息 |）
-        if in_table and line.startswith("|"):
-            # 分割表格列（去除首尾空字符）
-            cols = [col.strip() for col in line.split("|") if col.strip()]
-            # 确保列数与表头一致（表头示例：| Feature Name | Commit SHA | ... | 共7列）
-            if len(cols) >= 7:
-                feature = {
-                    "name": cols[0],          # 特征名
-                    "sha": cols[1],           # 提交SHA
-                    "author": cols[2],        # 作者
-                    "branch": cols[3],        # 分支
-                    "date": cols[4],          # 日期
-                    "files_changed": cols[5], # 改动文件数
-                    "message": cols[6]        # 提交信息
-                }
-                features.append(feature)
+        name, sha, author, branch, date, files_changed, message = (part.strip() for part in parts[:7])
+        # 检查关键字段是否为空（表格格式标准化）
+        if not name or not sha or not author:
+            raise ValueError(f"特征表格行存在空关键字段：{line}")
+        features.append(Feature(name, sha, author, branch, date, files_changed, message))
     
     return features
 
-def run_verification(config: Dict, github_token: str, github_org: str) -> bool:
+# 优先使用Cython编译的解析函数（python setup.py build_ext --inplace），未编译时使用上面的纯Python版本
+# 纯Python版本始终保留为_py_parse_feature_table（供测试比对两个版本的解析结果）
+_py_parse_feature_table = parse_feature_table
+try:
+    from _parse_feature_table import parse_feature_table as _c_parse_feature_table
+except ImportError:
+    _c_parse_feature_table = None
+else:
+    def parse_feature_table(content: str, table_header: str) -> List[Feature]:
+        """解析Markdown文档中的特征表格（Cython编译版本，特征行类型统一使用本模块的Feature）"""
+        return _c_parse_feature_table(content, table_header, Feature)
+
+def run_verification(
+    config: Dict,
+    github_token: str,
+    github_org: str,
+    cache_path: Optional[str] = None
+) -> None:
     """
     执行完整验证流程
-    返回：True（验证通过）/ False（验证失败）
+    cache_path：HTTP响应缓存文件路径（None表示不使用磁盘缓存）
+    验证失败时抛出VerificationError（异常信息为汇总的错误信息）
     """
-    # 初始化GitHub请求头
-    headers = get_github_headers(github_token)
+    # 初始化GitHub会话（所有请求复用同一连接）
+    session = create_github_session(github_token, cache_path)
     # 提取配置参数（简化后续调用）
     repo = config["target_repo"]
     branch = config["target_branch"]
@@ -219,127 +483,137 @@ def run_verification(config: Dict, github_token: str, github_org: str) -> bool:
     print(f"📋 开始验证：{github_org}/{repo}@{branch}")
     print(f"📄 目标文档：{doc_path}")
     print("=" * 60)
+    # 文档获取（步骤1）与提交详情获取（步骤6）互不依赖：提交详情在后台守护线程中与文档请求同时发起，
+    # 节省一次网络往返；验证提前失败时进程直接退出，不等待后台请求
+    commits_result = _run_in_background(verify_commits, list(expected_authors), session, github_org, repo)
 
     # --------------------------
     # 步骤1：获取特征文档内容
     # --------------------------
     print("\n1. 📥 获取特征文档...")
-    doc_content = fetch_github_file(doc_path, headers, github_org, repo, branch)
+    doc_content = fetch_github_file(doc_path, session, github_org, repo, branch)
     if not doc_content:
-        return False
+        raise VerificationError(f"❌ 错误：文件 {doc_path} 内容为空")
     print(f"✅ 成功获取文档（大小：{len(doc_content)} 字符）")
 
     # --------------------------
     # 步骤2：验证文档必填章节
     # --------------------------
     print(f"\n2. 📝 验证文档章节...")
-    for section in required_sections:
-        if section not in doc_content:
-            print(f"❌ 缺失必填章节：「{section}」", file=sys.stderr)
-            return False
+    errors: List[str] = []  # 每个步骤的错误信息（步骤结束时一次性输出）
+    for section in find_missing_sections(doc_content, required_sections):
+        errors.append(f"❌ 缺失必填章节：「{section}」")
+    _raise_if_errors(errors)
     print(f"✅ 所有 {len(required_sections)} 个必填章节均存在")
 
     # --------------------------
     # 步骤3：解析特征表格
     # --------------------------
     print(f"\n3. 🔍 解析特征表格...")
-    features = parse_feature_table(doc_content, table_header)
+    try:
+        features = parse_feature_table(doc_content, table_header)
+    except ValueError as e:
+        raise VerificationError(f"❌ {str(e)}")
     if len(features) == 0:
-        print("❌ 未解析到任何特征（表格格式可能错误）", file=sys.stderr)
-        return False
+        errors.append("❌ 未解析到任何特征（表格格式可能错误）")
+    _raise_if_errors(errors)
     print(f"✅ 解析到 {len(features)} 个特征")
+    # 建立特征索引（步骤5、6共用，避免重复遍历特征列表；同一SHA可对应多个特征行，按表格顺序保存）
+    by_name: Dict[str, Feature] = {}
+    by_sha: Dict[str, List[Feature]] = {}
+    for feat in features:
+        by_name[feat.name] = feat
+        by_sha.setdefault(feat.sha, []).append(feat)
 
     # --------------------------
     # 步骤4：验证特征数量
     # --------------------------
     print(f"\n4. 📊 验证特征数量...")
     if len(features) < min_feat_count:
-        print(f"❌ 特征数量不足（预期≥{min_feat_count}，实际={len(features)}）", file=sys.stderr)
-        return False
+        errors.append(f"❌ 特征数量不足（预期≥{min_feat_count}，实际={len(features)}）")
+    _raise_if_errors(errors)
     print(f"✅ 特征数量满足要求（{len(features)} ≥ {min_feat_count}）")
 
     # --------------------------
     # 步骤5：验证预期特征与SHA
     # --------------------------
     print(f"\n5. 🔗 验证特征与SHA匹配...")
-    feat_name_to_sha = {feat["name"]: feat["sha"] for feat in features}
+    # 检查特征是否存在（集合差集一次找出全部缺失特征）
+    missing = expected_feats.keys() - by_name.keys()
+    if missing:
+        errors.append(f"❌ 预期特征未在表格中找到：{sorted(missing)}")
+    # 检查SHA是否匹配（汇总所有不匹配的特征）
     for expected_name, expected_sha in expected_feats.items():
-        # 检查特征是否存在
-        if expected_name not in feat_name_to_sha:
-            print(f"❌ 预期特征「{expected_name}」未在表格中找到", file=sys.stderr)
-            return False
-        # 检查SHA是否匹配
-        actual_sha = feat_name_to_sha[expected_name]
-        if actual_sha != expected_sha:
-            print(f"❌ 特征「{expected_name}」SHA不匹配：")
-            print(f"   预期：{expected_sha[:8]}...")
-            print(f"   实际：{actual_sha[:8]}...", file=sys.stderr)
-            return False
+        feat = by_name.get(expected_name)
+        actual_sha = feat.sha if feat else None
+        if actual_sha is not None and actual_sha != expected_sha:
+            errors.append(f"❌ 特征「{expected_name}」SHA不匹配：")
+            errors.append(f"   预期：{expected_sha[:8]}...")
+            errors.append(f"   实际：{actual_sha[:8]}...")
+    _raise_if_errors(errors)
     print(f"✅ 所有 {len(expected_feats)} 个预期特征SHA均匹配")
 
     # --------------------------
     # 步骤6：验证提交详情（作者、信息、日期）
     # --------------------------
     print(f"\n6. 📅 验证提交详情...")
-    for feat in features:
-        feat_sha = feat["sha"]
-        # 仅验证配置中指定的预期提交
-        if feat_sha not in expected_authors:
-            continue
-        
-        # 验证提交是否存在
-        commit_detail = verify_commit(feat_sha, headers, github_org, repo)
-        if not commit_detail:
-            return False
-        
-        # 验证作者
-        expected_author = expected_authors[feat_sha]
-        actual_author = commit_detail.get("author", {}).get("login", "")
-        if actual_author != expected_author:
-            print(f"❌ 提交 {feat_sha[:8]} 作者不匹配：")
-            print(f"   预期：{expected_author}")
-            print(f"   实际：{actual_author}", file=sys.stderr)
-            return False
-        
-        # 验证提交信息（表格中的信息 vs 实际提交信息）
-        expected_msg = expected_msgs[feat_sha]
-        # 表格中的信息
-        if feat["message"] != expected_msg:
-            print(f"❌ 提交 {feat_sha[:8]} 表格信息不匹配：")
-            print(f"   预期：{expected_msg}")
-            print(f"   实际：{feat['message']}", file=sys.stderr)
-            return False
-        # GitHub实际提交信息（取第一行）
-        actual_commit_msg = commit_detail.get("commit", {}).get("message", "").split("\n")[0]
-        if actual_commit_msg != expected_msg:
-            print(f"❌ 提交 {feat_sha[:8]} GitHub信息不匹配：")
-            print(f"   预期：{expected_msg}")
-            print(f"   实际：{actual_commit_msg}", file=sys.stderr)
-            return False
-        
-        # 验证日期（格式+内容）
-        expected_date = expected_dates[feat_sha]
-        # 检查日期格式（YYYY-MM-DD）
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", feat["date"]):
-            print(f"❌ 特征「{feat['name']}」日期格式错误（应为YYYY-MM-DD）：{feat['date']}", file=sys.stderr)
-            return False
-        # 检查日期内容
-        if feat["date"] != expected_date:
-            print(f"❌ 提交 {feat_sha[:8]} 日期不匹配：")
-            print(f"   预期：{expected_date}")
-            print(f"   实际：{feat['date']}", file=sys.stderr)
-            return False
-    print(f"✅ 所有 {len(expected_authors)} 个提交详情均验证通过")
+    if not expected_authors:
+        print("✅ 无需验证的预期提交")
+    else:
+        # 仅验证配置中指定的预期提交（按配置逐个查找，不遍历整个特征表格）；
+        # 提交详情已在启动时于后台获取，此处按配置顺序串行校验（保证报错顺序确定）
+        commit_details, commit_errors = commits_result()
+        for feat_sha, expected_author in expected_authors.items():
+            feats = by_sha.get(feat_sha)
+            if not feats:
+                errors.append(f"❌ 预期提交 {feat_sha[:8]} 未在表格中找到")
+                continue
+            
+            # 验证提交是否存在
+            commit_detail = commit_details[feat_sha]
+            if not commit_detail:
+                errors.append(commit_errors.get(feat_sha, f"❌ 错误：提交 {feat_sha[:8]} 详情获取失败"))
+                continue
+            
+            # 验证作者
+            actual_author = commit_detail["login"]
+            if actual_author != expected_author:
+                errors.append(f"❌ 提交 {feat_sha[:8]} 作者不匹配：")
+                errors.append(f"   预期：{expected_author}")
+                errors.append(f"   实际：{actual_author}")
+            
+            # 验证提交信息（GitHub实际提交信息，取第一行；每个SHA只校验一次）
+            expected_msg = expected_msgs[feat_sha]
+            actual_commit_msg = commit_detail["message"]
+            if actual_commit_msg != expected_msg:
+                errors.append(f"❌ 提交 {feat_sha[:8]} GitHub信息不匹配：")
+                errors.append(f"   预期：{expected_msg}")
+                errors.append(f"   实际：{actual_commit_msg}")
+            
+            # 表格侧校验：同一SHA的每个特征行都需校验提交信息与日期
+            expected_date = expected_dates[feat_sha]
+            for feat in feats:
+                # 表格中的信息
+                if feat.message != expected_msg:
+                    errors.append(f"❌ 提交 {feat_sha[:8]} 表格信息不匹配（特征「{feat.name}」）：")
+                    errors.append(f"   预期：{expected_msg}")
+                    errors.append(f"   实际：{feat.message}")
+                # 检查日期格式（YYYY-MM-DD）
+                if not _is_iso_date(feat.date):
+                    errors.append(f"❌ 特征「{feat.name}」日期格式错误（应为YYYY-MM-DD）：{feat.date}")
+                # 检查日期内容
+                elif feat.date != expected_date:
+                    errors.append(f"❌ 提交 {feat_sha[:8]} 日期不匹配（特征「{feat.name}」）：")
+                    errors.append(f"   预期：{expected_date}")
+                    errors.append(f"   实际：{feat.date}")
+        _raise_if_errors(errors)
+        print(f"✅ 所有 {len(expected_authors)} 个提交详情均验证通过")
 
     # --------------------------
     # 步骤7：验证表格格式标准化
     # --------------------------
     print(f"\n7. 📋 验证表格格式标准化...")
-    for feat in features:
-        # 检查关键字段是否为空
-        if not feat["name"] or not feat["sha"] or not feat["author"]:
-            print(f"❌ 特征表格行存在空关键字段：{feat}", file=sys.stderr)
-            return False
+    # 关键字段非空检查已在解析表格时完成（步骤3）
     print(f"✅ 表格格式标准化验证通过")
 
     # --------------------------
@@ -356,7 +630,6 @@ def run_verification(config: Dict, github_token: str, github_org: str) -> bool:
     print(f"   - 验证的预期特性数量：{len(expected_feats)}")
     print(f"   - 通过的检查项目：7项（文档存在性、章节完整性、表格解析、特性数量、SHA一致性、提交详情、表格格式）")
     print("=" * 60)
-    return True
 
 # ==========================
 # 4. 入口函数（通用无需修改）
@@ -376,6 +649,15 @@ def main():
         default=DEFAULT_ENV_FILE,
         help=f"环境文件路径（默认：{DEFAULT_ENV_FILE}）"
     )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        nargs="?",
+        const=DEFAULT_CACHE_FILE,
+        default=None,
+        help=f"启用HTTP响应缓存并指定缓存文件路径（仅写 --cache 时使用 {DEFAULT_CACHE_FILE}；默认不缓存）。"
+             "缓存文件包含文档完整内容（含私有仓库内容），请勿提交到版本库"
+    )
     args = parser.parse_args()
     # 1. 加载环境变量（Token、组织名）
     print(f"📌 加载环境变量：{args.env}")
@@ -385,9 +667,14 @@ def main():
     project_config = load_project_config(args.config)
     # 3. 执行核心验证逻辑
     print("\n" + "-" * 50)
-    verification_result = run_verification(project_config, github_token, github_org)
     # 4. 根据验证结果退出程序（0=成功，1=失败）
-    sys.exit(0 if verification_result else 1)
+    try:
+        run_verification(project_config, github_token, github_org, args.cache)
+    except VerificationError as e:
+        sys.stdout.flush()  # 先输出已有进度信息，保证与错误信息的先后顺序
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    sys.exit(0)
 
 # 脚本入口（当直接执行脚本时触发）
 if __name__ == "__main__":
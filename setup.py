@@ -0,0 +1,27 @@
+# =============================================================================
+# 可选：编译特征表格解析的Cython扩展（_parse_feature_table.pyx）
+# =============================================================================
+# 编译命令：pip install cython && python setup.py build_ext --inplace
+# 未安装Cython或未编译时 commit_verifier.py 自动使用纯Python版本，功能完全一致（见 tests/ 中的一致性测试）
+# =============================================================================
+from setuptools import setup
+
+# 未安装Cython时跳过扩展编译（纯源码安装仍可正常使用）
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize("_parse_feature_table.pyx", language_level=3)
+
+setup(
+    name="github-commit-verifier",
+    py_modules=["commit_verifier"],
+    ext_modules=ext_modules,
+    python_requires=">=3.6",
+    install_requires=["requests", "python-dotenv", "pyyaml"],
+    extras_require={
+        "fast": ["orjson"],     # 更快的JSON解析
+        "cython": ["cython"],   # 编译_parse_feature_table扩展
+    },
+)
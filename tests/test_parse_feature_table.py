@@ -0,0 +1,86 @@
+# =============================================================================
+# 特征表格解析测试
+# =============================================================================
+# 执行命令：python -m unittest discover tests
+# =============================================================================
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import commit_verifier  # noqa: E402
+
+HEADER = "| Feature Name | Commit SHA | Author | Branch | Date | Files Changed | Message |"
+DOC = "\n".join([
+    "# Feature Development Tracking",
+    "",
+    "## Feature Commit History",
+    "",
+    HEADER,
+    "|--------------|------------|--------|--------|------|---------------|---------|",
+    "| Feature A | 1111111 | alice | main | 2025-09-16 | 1 | Add A |",
+    "| Feature B | 2222222 | bob | main | 2025-09-17 | 2 | Add B |",
+    "",
+    "## Feature Approval Process",
+    "",
+    "| Not | A | Feature | Row | 2025-01-01 | 0 | Ignored |",
+])
+
+
+class ParseFeatureTableTest(unittest.TestCase):
+    def test_heading_ends_table(self):
+        # 表格后的「## 章节」行结束表格，其后的表格形状行不应被解析为特征
+        features = commit_verifier.parse_feature_table(DOC, HEADER)
+        self.assertEqual([feat.name for feat in features], ["Feature A", "Feature B"])
+
+
+# 一致性测试用的表格行片段（覆盖分隔线、缩进、章节标记、空单元格、无结尾|等情况）
+PIECES = [
+    HEADER,
+    "| a | b | c | d | e | f | g |",
+    "| :-- | --- | :-: |",
+    "|---|",
+    "  | x | y | z | w | v | u | t | \r",
+    "\t|a|b|c|d|e|f|g|h|\t ",
+    "|a|b|c|d|e|f|g",
+    "| a | b | c | d | e | f | |",
+    "| a |  | c | d | e | f | g |",
+    "| | |",
+    "## Section",
+    "  ## Indented section",
+    "text ## inline",
+    "text",
+    "",
+]
+
+
+def _parse(parser, content):
+    """调用解析函数，ValueError转换为可比较的结果"""
+    try:
+        return parser(content, HEADER)
+    except ValueError as e:
+        return ("ValueError", str(e))
+
+
+@unittest.skipIf(commit_verifier._c_parse_feature_table is None, "未编译Cython扩展")
+class CythonParityTest(unittest.TestCase):
+    def test_returns_module_feature_type(self):
+        features = commit_verifier.parse_feature_table(DOC, HEADER)
+        self.assertTrue(all(type(feat) is commit_verifier.Feature for feat in features))
+
+    def test_matches_python_parser(self):
+        rng = random.Random(0)
+        docs = [DOC, ""]
+        docs += ["\n".join(rng.choice(PIECES) for _ in range(rng.randint(0, 10))) for _ in range(5000)]
+        for doc in docs:
+            self.assertEqual(
+                _parse(commit_verifier.parse_feature_table, doc),
+                _parse(commit_verifier._py_parse_feature_table, doc),
+                repr(doc)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()